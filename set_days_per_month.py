@@ -21,11 +21,17 @@ import os
 import sys
 import shutil
 import datetime as dt
+from collections import Counter
 import re
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from pathlib import Path
 
+# lxml keeps the whole pipeline on libxml2's C parser/serializer; the stdlib
+# xml.etree can silently fall back to its pure-Python implementation.
+try:
+    from lxml import etree as ET
+except ImportError:
+    raise SystemExit("lxml is required; install it with 'py -m pip install lxml'")
+
 POSSIBLE_ENV_PATHS = [
     "environment.xml",
     os.path.join("config", "environment.xml"),
@@ -34,22 +40,75 @@ POSSIBLE_ENV_PATHS = [
 PRIMARY_DAY_TAG = "daysPerPeriod"
 DAY_TAG_SYNONYMS = ["daysPerMonth", "plannedDaysPerPeriod"]
 
+# Shared parser: huge_tree lifts libxml2's size guards for oversized saves,
+# remove_blank_text drops indentation-only text so pretty_print re-indents
+# cleanly, collect_ids skips an ID hash table savegames never use.
+_PARSER = ET.XMLParser(huge_tree=True, remove_blank_text=True, collect_ids=False)
+
+# Precompiled XPath lookups: compiled once here, evaluated in C per call.
+_XP_ENVIRONMENT = ET.XPath(".//environment")
+_XP_SETTINGS = ET.XPath("./settings")
+_XP_PLANNED_DAYS = ET.XPath("./plannedDaysPerPeriod")
+_XP_STATISTICS = ET.XPath("./statistics")
+_XP_FINANCES = ET.XPath("./finances")
+_XP_FIN_STATS = ET.XPath("./stats")
+
+def _xp_first(xp: ET.XPath, node: ET._Element):
+    hits = xp(node)
+    return hits[0] if hits else None
+
+_FIND_CACHE = {}
+
+def _find_cached(xp: ET.XPath, node: ET._Element):
+    """
+    _xp_first with per-(node, expression) memoization, for nodes queried
+    several times in one run (environment/careerSavegame roots). Not used
+    for the streamed farm elements, whose ids are recycled as they're freed.
+    """
+    key = (id(node), xp.path)
+    el = _FIND_CACHE.get(key)
+    if el is None:
+        el = _xp_first(xp, node)
+        _FIND_CACHE[key] = el
+    return el
+
 # -------------------------
 # Pretty XML write / backup
 # -------------------------
-def pretty_write_xml(tree: ET.ElementTree, path: Path, dry_run: bool = False):
-    xml_bytes = ET.tostring(tree.getroot(), encoding="utf-8")
-    reparsed = minidom.parseString(xml_bytes)
-    pretty = reparsed.toprettyxml(indent="  ", encoding="utf-8")
+def write_xml(tree, path: Path, pretty: bool = False, dry_run: bool = False):
+    # The game ignores whitespace, so the default is a compact single-pass
+    # write; --pretty opts back into indented output for hand inspection.
     if dry_run:
         return
-    with open(path, "wb") as f:
-        f.write(pretty)
-
-def timestamped_backup(path: Path) -> Path:
-    ts = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tree.write(tmp_path, pretty_print=pretty, xml_declaration=True, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+def pretty_write_xml(tree, path: Path, dry_run: bool = False):
+    write_xml(tree, path, pretty=True, dry_run=dry_run)
+
+_RUN_TS = None
+
+def timestamped_backup(path: Path, ts: str = None) -> Path:
+    # All backups of one run share a stamp, so a single wildcard delete (or
+    # restore) rolls the whole run back; also avoids re-formatting now() per file.
+    global _RUN_TS
+    if ts is None:
+        if _RUN_TS is None:
+            _RUN_TS = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = _RUN_TS
     bak = path.with_suffix(path.suffix + f".{ts}.bak")
-    path.replace(bak)
+    try:
+        os.link(path, bak)  # metadata-only, no bytes copied on the same filesystem
+    except FileExistsError:
+        # Already backed up earlier this run; that copy holds the pre-run
+        # content, so never overwrite it with the since-modified file.
+        pass
+    except OSError:
+        # Same guard for the no-hardlink fallback: os.link reports a plain
+        # OSError on such filesystems even when bak already exists.
+        if not bak.exists():
+            shutil.copy2(path, bak)
     return bak
 
 def ensure_exists(path: Path, label: str):
@@ -66,37 +125,67 @@ def find_environment_xml(save_dir: Path) -> Path:
             return candidate
     raise FileNotFoundError(f"environment.xml not found in {save_dir} (tried {POSSIBLE_ENV_PATHS})")
 
-def ensure_child(parent: ET.Element, tag: str) -> ET.Element:
+def ensure_child(parent: ET._Element, tag: str) -> ET._Element:
     node = parent.find(tag)
     if node is None:
         node = ET.SubElement(parent, tag)
     return node
 
-def set_days_per_period(root: ET.Element, value: int):
-    env = root if root.tag == "environment" else (root.find(".//environment") or root)
-    primary = ensure_child(env, PRIMARY_DAY_TAG)
-    primary.text = str(value)
-    for tag in DAY_TAG_SYNONYMS:
-        el = root.find(f".//{tag}")
-        if el is not None:
+def _collect_by_tag(root: ET._Element, tags) -> dict:
+    """One walk of the tree, collecting every element whose tag is in `tags`."""
+    found = {t: [] for t in tags}
+    for el in root.iter():
+        lst = found.get(el.tag)
+        if lst is not None:
+            lst.append(el)
+    return found
+
+def set_days_per_period(root: ET._Element, value: int):
+    found = _collect_by_tag(root, ("environment", PRIMARY_DAY_TAG, *DAY_TAG_SYNONYMS))
+    env = found["environment"][0] if found["environment"] else root
+    if not found[PRIMARY_DAY_TAG]:
+        found[PRIMARY_DAY_TAG].append(ET.SubElement(env, PRIMARY_DAY_TAG))
+    for tag in (PRIMARY_DAY_TAG, *DAY_TAG_SYNONYMS):
+        for el in found[tag]:
             el.text = str(value)
 
-def clear_forecast(root: ET.Element) -> int:
+# Forecast caches to clear: parent tag -> child tag to strip.
+_FORECAST_CHILD_TAGS = {
+    "weatherForecast": "period",
+    "weather": "object",
+    "weatherObjects": "object",
+}
+
+def clear_forecast(root: ET._Element) -> int:
+    # Explicit-stack DFS: subtrees queued for removal are never descended
+    # into, and removals are batched per parent after its children are walked.
     removed = 0
-    def _remove_children_named(parent_xpath: str, child_tag: str):
-        nonlocal removed
-        for parent in root.findall(parent_xpath):
-            for child in list(parent.findall(child_tag)):
-                parent.remove(child)
-                removed += 1
-    _remove_children_named(".//weatherForecast", "period")
-    _remove_children_named(".//weather", "object")
-    _remove_children_named(".//weatherObjects", "object")
+    stack = [root]
+    while stack:
+        parent = stack.pop()
+        child_tag = _FORECAST_CHILD_TAGS.get(parent.tag)
+        if child_tag is None:
+            stack.extend(parent)
+            continue
+        keep = [c for c in parent if c.tag != child_tag]
+        if len(keep) != len(parent):
+            # One slice assignment instead of per-child remove() calls,
+            # each of which does a linear search for the child.
+            removed += len(parent) - len(keep)
+            parent[:] = keep
+        stack.extend(keep)
     return removed
 
 # -------------------------
 # Current day recompute
 # -------------------------
+def validate_days(days: int) -> int:
+    if days < 1:
+        raise ValueError("days-per-period must be at least 1")
+    if days > 28:
+        raise ValueError("days-per-period above 28 is not supported by FS25")
+    return days
+
 def compute_new_current_day(old_current: int, old_days: int, new_days: int, keep_day: bool, target_day: int) -> int:
     if old_days <= 0 or new_days <= 0:
         raise ValueError("days-per-period must be positive")
@@ -119,12 +208,12 @@ def update_career_planned_days(save_dir: Path, days: int, no_backup: bool, dry_r
     ensure_exists(career_path, "careerSavegame.xml")
     if verbose:
         print(f"[info] Opening {career_path}")
-    tree = ET.parse(career_path)
+    tree = ET.parse(career_path, _PARSER)
     root = tree.getroot()
-    settings = root.find("./settings")
+    settings = _find_cached(_XP_SETTINGS, root)
     if settings is None:
         settings = ET.SubElement(root, "settings")
-    node = settings.find("plannedDaysPerPeriod")
+    node = _find_cached(_XP_PLANNED_DAYS, settings)
     if node is None:
         node = ET.SubElement(settings, "plannedDaysPerPeriod")
     current = (node.text or "").strip()
@@ -140,107 +229,242 @@ def update_career_planned_days(save_dir: Path, days: int, no_backup: bool, dry_r
             if verbose:
                 print(f"[info] Backup created: {bak}")
         if not dry_run:
-            tree.write(career_path, encoding="utf-8", xml_declaration=True)
+            tmp_path = career_path.with_suffix(career_path.suffix + ".tmp")
+            tree.write(tmp_path, encoding="utf-8", xml_declaration=True, pretty_print=True)
+            os.replace(tmp_path, career_path)
             if verbose:
                 print(f"[ok] careerSavegame.xml updated")
 
 # -------------------------
 # farms.xml statistics reset
 # -------------------------
-_FLOAT_RE = re.compile(r"^-?\d+\.\d+$")
-_INT_RE   = re.compile(r"^-?\d+$")
-
 def _zero_like(value: str) -> str:
+    # Hot path: called once per leaf in farms.xml. A single character scan
+    # replaces the two anchored regex matches this used to do per call.
     val = (value or "").strip()
-    if _FLOAT_RE.match(val):
-        return "0.000000"
-    if _INT_RE.match(val):
+    sign = 1 if val[:1] in ("-", "+") else 0
+    if sign == len(val):
+        return "0"
+    dot = digits = False
+    for c in val[sign:]:
+        if c == ".":
+            if dot:
+                return "0"
+            dot = True
+        elif c.isdigit():
+            digits = True
+        else:
+            return "0"
+    if not digits:
         return "0"
-    return "0"
+    return "0.000000" if dot else "0"
 
-def reset_farm_statistics(farms_xml_path: Path, verbose: bool = False, dry_run: bool = False, no_backup: bool = False) -> int:
-    ensure_exists(farms_xml_path, "farms.xml")
-    if verbose:
-        print(f"[info] Opening {farms_xml_path}")
-    tree = ET.parse(farms_xml_path)
-    root = tree.getroot()
+def _zero_statistics(farm, counts, debug: bool = False) -> int:
+    stats = _xp_first(_XP_STATISTICS, farm)
+    if stats is None:
+        return 0
     changed = 0
-    for farm in root.findall("./farm"):
-        stats = farm.find("statistics")
-        if stats is None:
+    for node in stats:
+        if not isinstance(node.tag, str) or node.tag == "farmId":
             continue
-        for node in list(stats):
-            if node.tag == "farmId":
+        old = (node.text or "").strip()
+        new = _zero_like(old)
+        if old != new:
+            node.text = new
+            changed += 1
+            counts[node.tag] += 1
+            if debug:
+                print(f"[debug]  {node.tag}: '{old}' -> '{new}'")
+    return changed
+
+def _zero_finances(farm, counts, debug: bool = False) -> int:
+    finances = _xp_first(_XP_FINANCES, farm)
+    if finances is None:
+        return 0
+    changed = 0
+    for stats in _XP_FIN_STATS(finances):
+        # Iterate all direct children under <stats> (and nested ones, to be safe).
+        for node in stats.iter():
+            if node is stats or not isinstance(node.tag, str):
+                continue  # skip the container element itself (and comments)
+            # Only attempt to zero leaf nodes that have text content
+            text = (node.text or "").strip()
+            if text == "":
                 continue
-            old = (node.text or "").strip()
-            new = _zero_like(old)
-            if old != new:
-                node.text = new
+            new_text = _zero_like(text)
+            if text != new_text:
+                node.text = new_text
                 changed += 1
-                if verbose:
-                    print(f"[info]  {node.tag}: '{old}' -> '{new}'")
+                counts[f"finances.stats/{node.tag}"] += 1
+                if debug:
+                    print(f"[debug]  finances.stats/{node.tag}: '{text}' -> '{new_text}'")
+    return changed
+
+def _stream_rewrite_farms(farms_xml_path: Path, mutate, verbose: bool = False, dry_run: bool = False, no_backup: bool = False) -> int:
+    """
+    Stream farms.xml through lxml's incremental parser/writer: each <farm>
+    is parsed, passed to `mutate`, written to a temp file and freed, so
+    memory stays flat regardless of save size. The temp file replaces
+    farms.xml atomically, and only if anything changed.
+    Returns the number of fields changed.
+    """
+    ensure_exists(farms_xml_path, "farms.xml")
+    tmp_path = farms_xml_path.with_suffix(farms_xml_path.suffix + ".tmp")
+    changed = 0
+    context = ET.iterparse(str(farms_xml_path), events=("start", "end"),
+                            huge_tree=True, remove_blank_text=True)
+    try:
+        with ET.xmlfile(str(tmp_path), encoding="utf-8") as xf:
+            xf.write_declaration()
+            _, root = next(context)
+            with xf.element(root.tag, dict(root.attrib)):
+                for event, elem in context:
+                    if event != "end" or elem.getparent() is not root:
+                        continue
+                    if elem.tag == "farm":
+                        changed += mutate(elem)
+                    xf.write(elem, pretty_print=True)
+                    # Free the processed farm and any siblings already written.
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del root[0]
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if changed == 0 or dry_run:
+        tmp_path.unlink(missing_ok=True)
+        return changed
+    if not no_backup:
+        bak = timestamped_backup(farms_xml_path)
+        if verbose:
+            print(f"[info] Backup created: {bak}")
+    os.replace(tmp_path, farms_xml_path)
+    return changed
+
+def reset_farm_xml(farms_xml_path: Path, do_stats: bool = False, do_finances: bool = False,
+                   verbose: bool = False, dry_run: bool = False, no_backup: bool = False,
+                   debug: bool = False) -> int:
+    """
+    Apply the statistics and/or finances reset in one streaming pass over
+    farms.xml, so requesting both costs a single parse and a single write.
+    Preserves numeric style (ints -> '0', floats -> '0.000000').
+    Returns the number of fields changed.
+    """
+    if not (do_stats or do_finances):
+        return 0
+    ensure_exists(farms_xml_path, "farms.xml")
+    if verbose:
+        print(f"[info] Opening {farms_xml_path}")
+    data = farms_xml_path.read_bytes()
+    if do_stats and not _probe_has_work(data, _STATS_BLOCK_RE, skip_tags=(b"farmId",)):
+        if verbose:
+            print("[info] No statistic fields required changes.")
+        do_stats = False
+    if do_finances and not _probe_has_work(data, _FIN_BLOCK_RE):
+        if verbose:
+            print("[info] No finance values required changes.")
+        do_finances = False
+    if not (do_stats or do_finances):
+        return 0
+
+    # Per-tag tallies instead of a print per leaf: stdout flushing per change
+    # can dominate wall-clock on a big farms.xml under --verbose.
+    counts = Counter()
+
+    def mutate(farm):
+        n = 0
+        if do_stats:
+            n += _zero_statistics(farm, counts, debug=debug)
+        if do_finances:
+            n += _zero_finances(farm, counts, debug=debug)
+        return n
+
+    changed = _stream_rewrite_farms(farms_xml_path, mutate, verbose=verbose, dry_run=dry_run, no_backup=no_backup)
     if changed > 0:
-        if not dry_run and not no_backup:
-            bak = timestamped_backup(farms_xml_path)
-            if verbose:
-                print(f"[info] Backup created: {bak}")
-        if not dry_run:
-            tree.write(farms_xml_path, encoding="utf-8", xml_declaration=True)
-            if verbose:
-                print(f"[ok] farms.xml statistics updated")
+        if verbose:
+            print("\n".join(f"[info]  {tag}: {n} zeroed" for tag, n in counts.most_common()))
+        if verbose and not dry_run:
+            print(f"[ok] farms.xml updated ({changed} field(s) zeroed)")
     elif verbose:
-        print("[info] No statistic fields required changes.")
+        print("[info] No fields required changes.")
     return changed
 
+def reset_farm_statistics(farms_xml_path: Path, verbose: bool = False, dry_run: bool = False, no_backup: bool = False, debug: bool = False) -> int:
+    return reset_farm_xml(farms_xml_path, do_stats=True, verbose=verbose, dry_run=dry_run, no_backup=no_backup, debug=debug)
+
 # -------------------------
 # farms.xml finances reset
 # -------------------------
 
-def reset_farm_finances(farms_xml_path: Path, verbose: bool = False, dry_run: bool = False, no_backup: bool = False) -> int:
+def reset_farm_finances(farms_xml_path: Path, verbose: bool = False, dry_run: bool = False, no_backup: bool = False, debug: bool = False) -> int:
     """
     Zero out numeric values inside each <finances>/<stats> block for every <farm> in farms.xml.
     Preserves numeric style (ints -> '0', floats -> '0.000000').
     Returns the number of fields changed.
     """
+    return reset_farm_xml(farms_xml_path, do_finances=True, verbose=verbose, dry_run=dry_run, no_backup=no_backup, debug=debug)
+
+# -------------------------
+# farms.xml finances reset (byte-level fast path)
+# -------------------------
+_FIN_BLOCK_RE = re.compile(rb"<finances\b.*?</finances>", re.S)
+_STATS_BLOCK_RE = re.compile(rb"<statistics\b.*?</statistics>", re.S)
+_NUM_IN_TAG_RE = re.compile(rb">(-?\d+(?:\.\d+)?)<")
+_NONZERO_LEAF_RE = re.compile(rb"<([A-Za-z]\w*)\b[^>]*>([^<]*[1-9][^<]*)<")
+
+def _probe_has_work(data: bytes, block_re, skip_tags=()) -> bool:
+    """
+    C-level scan of the raw bytes for any non-zero digit in element text
+    within the given blocks; lets re-runs on an already-reset save skip the
+    XML parse entirely.
+    """
+    for block in block_re.finditer(data):
+        for m in _NONZERO_LEAF_RE.finditer(block.group(0)):
+            if m.group(1) not in skip_tags:
+                return True
+    return False
+
+def fast_reset_farm_finances(farms_xml_path: Path, verbose: bool = False, dry_run: bool = False, no_backup: bool = False):
+    """
+    Byte-level fast path for --reset-finances: zero numeric element text
+    inside <finances>...</finances> blocks with a single regex pass over the
+    raw bytes, skipping the XML parse entirely.
+    Returns the number of fields changed, or None if the file layout does
+    not look safe for a byte-level edit (caller falls back to the XML path).
+    """
     ensure_exists(farms_xml_path, "farms.xml")
-    if verbose:
-        print(f"[info] Opening {farms_xml_path}")
-    tree = ET.parse(farms_xml_path)
-    root = tree.getroot()
+    data = farms_xml_path.read_bytes()
+    # Bail out on anything the flat scan can't reason about.
+    if data.count(b"<finances") != data.count(b"</finances>"):
+        return None
     changed = 0
 
-    for farm in root.findall("./farm"):
-        finances = farm.find("finances")
-        if finances is None:
-            continue
-
-        for stats in finances.findall("stats"):
-            # Iterate all direct children under <stats> (and nested ones, to be safe).
-            for node in stats.iter():
-                if node is stats:
-                    continue  # skip the container element itself
-                # Only attempt to zero leaf nodes that have text content
-                text = (node.text or "").strip()
-                if text == "":
-                    continue
-                new_text = _zero_like(text)
-                if text != new_text:
-                    node.text = new_text
-                    changed += 1
-                    if verbose:
-                        print(f"[info]  finances.stats/{node.tag}: '{text}' -> '{new_text}'")
+    def _zero_num(m):
+        nonlocal changed
+        repl = b">0.000000<" if b"." in m.group(1) else b">0<"
+        if m.group(0) != repl:
+            changed += 1
+        return repl
 
-    if changed > 0:
-        if not dry_run and not no_backup:
+    new_data, nblocks = _FIN_BLOCK_RE.subn(lambda m: _NUM_IN_TAG_RE.sub(_zero_num, m.group(0)), data)
+    if nblocks == 0:
+        return None
+    if verbose:
+        print(f"[info] Fast finances scan: {nblocks} block(s), {changed} value(s) to zero")
+    if changed == 0:
+        if verbose:
+            print("[info] No finance values required changes.")
+        return 0
+    if not dry_run:
+        tmp_path = farms_xml_path.with_suffix(farms_xml_path.suffix + ".tmp")
+        tmp_path.write_bytes(new_data)
+        if not no_backup:
             bak = timestamped_backup(farms_xml_path)
             if verbose:
                 print(f"[info] Backup created: {bak}")
-        if not dry_run:
-            tree.write(farms_xml_path, encoding="utf-8", xml_declaration=True)
-            if verbose:
-                print(f"[ok] farms.xml finances values zeroed")
-    elif verbose:
-        print("[info] No finance values required changes.")
+        os.replace(tmp_path, farms_xml_path)
+        if verbose:
+            print(f"[ok] farms.xml finances values zeroed")
     return changed
 
 # -------------------------
@@ -252,7 +476,7 @@ def main():
                         help="Save folder name (e.g., savegame1) or full path to a save folder.")
     parser.add_argument("--days", type=int,
                         help="Set days per month (daysPerPeriod). If omitted, no day change is applied.")
-    parser.add_argument("--day", type=int, default=1,
+    parser.add_argument("--day", "--target-day", type=int, default=1, dest="day",
                         help="Target day within current month after change (default: 1). Ignored with --keep-day.")
     parser.add_argument("--keep-day", action="store_true",
                         help="Keep the old day-in-month when changing days-per-month (clamped if needed).")
@@ -260,35 +484,52 @@ def main():
                         help="Reset farms.xml <statistics> values to 0/0.000000 (keeps <farmId>).")
     parser.add_argument("--reset-finances", action="store_true",
                         help="Remove all <stats> entries inside <finances> for each farm in farms.xml.")
+    parser.add_argument("--fast-finances", action="store_true",
+                        help="With --reset-finances: zero values via a byte-level scan instead of an "
+                             "XML parse (falls back automatically if the file layout is unexpected).")
     parser.add_argument("--dry-run", action="store_true",
                         help="Preview changes without writing files.")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Pretty-print environment.xml on write. Default is a compact write; "
+                             "the game ignores whitespace and backups keep the original formatting.")
     parser.add_argument("--no-backup", action="store_true",
                         help="Do not create .bak backups before writing.")
     parser.add_argument("--verbose", action="store_true",
                         help="Verbose output.")
+    parser.add_argument("--debug", action="store_true",
+                        help="Print every individual field change (very verbose).")
     args = parser.parse_args()
 
-    save_dir = Path(args.save)
-    if not save_dir.exists():
-        common = Path.home() / "Documents" / "My Games" / "FarmingSimulator2025" / args.save
-        if common.exists():
-            save_dir = common
-        else:
-            rel = Path.cwd() / args.save
-            if rel.exists():
-                save_dir = rel
-            else:
-                raise FileNotFoundError(f"Could not resolve save directory from '{args.save}'.")
+    # Validate the requested day length up front, before any file is touched.
+    if args.days is not None:
+        validate_days(args.days)
+
+    # Candidates in priority order; is_dir() stops at the first hit and also
+    # rejects stray files that merely exist under the save name.
+    save_roots = [
+        Path(args.save),
+        Path.home() / "Documents" / "My Games" / "FarmingSimulator2025" / args.save,
+        Path.cwd() / args.save,
+    ]
+    save_dir = next((p for p in save_roots if p.is_dir()), None)
+    if save_dir is None:
+        raise FileNotFoundError(f"Could not resolve save directory from '{args.save}'.")
     if args.verbose:
         print(f"[info] Save directory: {save_dir}")
 
     # Independent operations on farms.xml
     if args.reset_stats or args.reset_finances:
         farms_xml = save_dir / "farms.xml"
-        if args.reset_stats:
-            reset_farm_statistics(farms_xml, verbose=args.verbose, dry_run=args.dry_run, no_backup=args.no_backup)
-        if args.reset_finances:
-            reset_farm_finances(farms_xml, verbose=args.verbose, dry_run=args.dry_run, no_backup=args.no_backup)
+        do_finances = args.reset_finances
+        if do_finances and args.fast_finances:
+            changed = fast_reset_farm_finances(farms_xml, verbose=args.verbose, dry_run=args.dry_run, no_backup=args.no_backup)
+            if changed is not None:
+                do_finances = False
+            elif args.verbose:
+                print("[info] Fast finances path unavailable; falling back to XML parse.")
+        reset_farm_xml(farms_xml, do_stats=args.reset_stats, do_finances=do_finances,
+                       verbose=args.verbose, dry_run=args.dry_run, no_backup=args.no_backup,
+                       debug=args.debug)
 
     # If no days change requested, stop here
     if args.days is None:
@@ -302,11 +543,14 @@ def main():
     if args.verbose:
         print(f"[info] Using environment.xml: {env_path}")
 
-    tree = ET.parse(env_path)
+    tree = ET.parse(env_path, _PARSER)
     root = tree.getroot()
 
+    # one walk picks up both nodes we need to read
+    found = _collect_by_tag(root, (PRIMARY_DAY_TAG, "currentDay"))
+
     # read old daysPerPeriod (default 3)
-    current_days_node = root.find(f".//{PRIMARY_DAY_TAG}")
+    current_days_node = found[PRIMARY_DAY_TAG][0] if found[PRIMARY_DAY_TAG] else None
     if current_days_node is None:
         old_days = 3
     else:
@@ -320,7 +564,7 @@ def main():
         print(f"[info] daysPerPeriod: old={old_days}, new={new_days}")
 
     # read currentDay (default 1)
-    current_day_node = root.find(".//currentDay")
+    current_day_node = found["currentDay"][0] if found["currentDay"] else None
     if current_day_node is None:
         old_current = 1
     else:
@@ -343,9 +587,10 @@ def main():
 
     set_days_per_period(root, new_days)
 
-    current_day_node = root.find(".//currentDay")
     if current_day_node is None:
-        parent = root.find(".//environment") or root
+        parent = _find_cached(_XP_ENVIRONMENT, root)
+        if parent is None:
+            parent = root
         current_day_node = ET.SubElement(parent, "currentDay")
     current_day_node.text = str(new_current)
 
@@ -358,7 +603,7 @@ def main():
         if args.verbose:
             print(f"[info] Backup created: {bak}")
     if not args.dry_run:
-        pretty_write_xml(tree, env_path)
+        write_xml(tree, env_path, pretty=args.pretty)
         if args.verbose:
             print("[ok] environment.xml updated]")
 